@@ -1,8 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings and configuration"""
 
@@ -28,29 +28,28 @@ class Settings:
 
     # Memory Management
     MAX_CACHE_ITEMS: int = 1000
-    CACHE_CLEANUP_THRESHOLD: int = 500
 
     # Performance Tuning
     MAX_PARALLEL_REQUESTS: int = 4
     REQUEST_TIMEOUT: int = 30
 
+    # Derived in __post_init__
+    headers: Dict[str, str] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validate settings after initialization"""
-        required_fields = [
-            'NVIDIA_API_KEY',
-            'PINECONE_API_KEY',
-            'PINECONE_INDEX_NAME',
-            'PINECONE_ENVIRONMENT'
-        ]
-
-        for field in required_fields:
-            if not getattr(self, field, None):
-                raise ValueError(f"Missing required configuration: {field}")
-
-    @property
-    def headers(self) -> Dict[str, str]:
-        return {
+        if not self.NVIDIA_API_KEY:
+            raise ValueError("Missing required configuration: NVIDIA_API_KEY")
+        if not self.PINECONE_API_KEY:
+            raise ValueError("Missing required configuration: PINECONE_API_KEY")
+        if not self.PINECONE_INDEX_NAME:
+            raise ValueError("Missing required configuration: PINECONE_INDEX_NAME")
+        if not self.PINECONE_ENVIRONMENT:
+            raise ValueError("Missing required configuration: PINECONE_ENVIRONMENT")
+
+        # Build request headers once; the instance is frozen so they can't go stale
+        object.__setattr__(self, "headers", {
             "Authorization": f"Bearer {self.NVIDIA_API_KEY}",
             "Content-Type": "application/json",
             "NVIDIA-API-ID": self.NVIDIA_API_ID
-        }
+        })
@@ -1,19 +1,23 @@
 import logging
-from typing import Dict, List, Any
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Any
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+MAX_HISTORY_ITEMS = 100
+
 
 class ConversationManager:
     def __init__(self, settings):
         self.settings = settings
-        self._history = {}  # Simple in-memory storage for demo
+        self._history: Dict[str, Deque[Dict[str, Any]]] = {}  # Simple in-memory storage for demo
 
     async def get_context(self, user_id: str) -> Dict[str, Any]:
         """Get conversation context including summary and recent messages"""
         try:
-            history = self._history.get(user_id, [])
+            history = self._history.get(user_id)
             if not history:
                 return {
                     'summary': '',
@@ -21,11 +25,11 @@ class ConversationManager:
                 }
 
             # For demo, return last few messages
-            recent_messages = history[-3:]
+            recent_messages = list(islice(history, max(0, len(history) - 3), None))
 
             # Simple summary (in production, you'd want more sophisticated summarization)
             summary = f"Previous conversation included {len(history)} messages about: " + \
-                      ", ".join([msg["message"][:30] + "..." for msg in history[-2:]])
+                      ", ".join([msg["message"][:30] + "..." for msg in recent_messages[-2:]])
 
             return {
                 'summary': summary,
@@ -38,19 +42,13 @@ class ConversationManager:
     async def add_message(self, user_id: str, message: str, response: str, context: Dict):
         """Add a new message to the conversation history"""
         try:
-            if user_id not in self._history:
-                self._history[user_id] = []
-
-            self._history[user_id].append({
+            # Bounded deque drops the oldest message once the limit is reached
+            self._history.setdefault(user_id, deque(maxlen=MAX_HISTORY_ITEMS)).append({
                 "message": message,
                 "response": response,
                 "context": context
             })
 
-            # Limit history size
-            if len(self._history[user_id]) > 100:
-                self._history[user_id] = self._history[user_id][-100:]
-
         except Exception as e:
             logger.error(f"Error adding message to history: {str(e)}")
 
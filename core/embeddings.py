@@ -1,31 +1,68 @@
 import aiohttp
 import numpy as np
-from typing import List
+import orjson
+from typing import Dict, List, Optional
 from config.settings import Settings
 from utils.async_utils import AsyncSessionManager
+from utils.cache import LRUCache, content_key
 
 
 class NvidiaEmbeddings(AsyncSessionManager):
-    def __init__(self, settings: Settings):
-        super().__init__(settings)
-
-    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
-        """Get embeddings for a list of texts"""
-        async with self._get_session() as session:
-            embeddings = []
-
-            for text in texts:
-                async with session.post(
-                        f"{self.settings.NVIDIA_BASE_URL}/embeddings",
-                        json={
-                            "model": self.settings.MODEL_NAME,
-                            "input": text
-                        }
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        embeddings.append(result["data"][0]["embedding"])
-                    else:
-                        raise Exception(f"Embedding error: {await response.text()}")
-
-            return embeddings
\ No newline at end of file
+    def __init__(self, settings: Settings, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(settings, session)
+        # Vectors are kept as float16 arrays: ~3KB each instead of ~43KB of boxed floats
+        self._emb_cache: LRUCache[np.ndarray] = LRUCache(settings.MAX_CACHE_ITEMS)
+
+    async def get_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Get embeddings for a list of texts as a (len(texts), dim) float16 array"""
+        if not texts:
+            return np.empty((0, self.settings.VECTOR_DIMENSION), dtype=np.float16)
+
+        keys = [content_key(text.encode()) for text in texts]
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+
+        # Serve hits from the cache and collect distinct misses
+        missing: Dict[int, str] = {}
+        for i, key in enumerate(keys):
+            cached = self._emb_cache.get(key)
+            if cached is not None:
+                embeddings[i] = cached
+            else:
+                missing.setdefault(key, texts[i])
+
+        if missing:
+            fetched = {
+                key: np.asarray(embedding, dtype=np.float16)
+                for key, embedding in zip(missing, await self._fetch_embeddings(list(missing.values())))
+            }
+            for key, embedding in fetched.items():
+                self._emb_cache.put(key, embedding)
+            for i, key in enumerate(keys):
+                if embeddings[i] is None:
+                    embeddings[i] = fetched[key]
+
+        return np.stack(embeddings)
+
+    async def _fetch_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for a list of texts in a single batched request"""
+        session = await self._get_session()
+        async with session.post(
+                f"{self.settings.NVIDIA_BASE_URL}/embeddings",
+                data=orjson.dumps({
+                    "model": self.settings.MODEL_NAME,
+                    "input": texts
+                })
+        ) as response:
+            if response.status != 200:
+                raise Exception(f"Embedding error: {await response.text()}")
+
+            result = orjson.loads(await response.read())
+
+        if len(result["data"]) != len(texts):
+            raise Exception(
+                f"Embedding error: expected {len(texts)} embeddings, got {len(result['data'])}"
+            )
+
+        # The endpoint may return items out of order; restore input order
+        data = sorted(result["data"], key=lambda item: item["index"])
+        return [item["embedding"] for item in data]
@@ -1,9 +1,10 @@
 import aiohttp
-import json
+import orjson
 import logging
 import asyncio
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
 from config.settings import Settings
+from utils.async_utils import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -11,9 +12,11 @@ logger = logging.getLogger(__name__)
 class LLMManager:
     """Manages LLM interactions with proper session handling"""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, session: Optional[aiohttp.ClientSession] = None):
         self.settings = settings
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        # Injected sessions are shared and closed by their owner
+        self._owns_session = session is None
         self._lock = asyncio.Lock()
         self._initialized = False
 
@@ -26,10 +29,9 @@ class LLMManager:
             logger.info("Initializing LLM Manager...")
             async with self._lock:
                 if not self._initialized:
-                    self.session = aiohttp.ClientSession(
-                        headers=self.settings.headers,
-                        timeout=aiohttp.ClientTimeout(total=self.settings.REQUEST_TIMEOUT)
-                    )
+                    if self.session is None:
+                        self.session = create_session(self.settings)
+                        self._owns_session = True
                     self._initialized = True
             logger.info("LLM Manager initialized successfully")
 
@@ -38,11 +40,20 @@ class LLMManager:
             await self.close()
             raise
 
+    async def use_session(self, session: aiohttp.ClientSession):
+        """Switch to a session owned by the caller, closing any session of our own"""
+        async with self._lock:
+            if self.session and self._owns_session:
+                await self.session.close()
+            self.session = session
+            self._owns_session = False
+
     async def close(self):
         """Close the session and cleanup resources"""
         if self.session:
             try:
-                await self.session.close()
+                if self._owns_session:
+                    await self.session.close()
                 self.session = None
                 self._initialized = False
                 logger.info("LLM Manager closed successfully")
@@ -52,42 +63,76 @@ class LLMManager:
 
     async def generate_response(self, messages: List[Dict[str, str]]) -> str:
         """Generate a response using the LLM"""
-        if not self._initialized:
-            raise RuntimeError("LLM Manager not initialized. Call initialize() first.")
+        # Create the session on first use rather than at chatbot startup
+        await self.initialize()
 
-        try:
-            payload = {
-                "model": self.settings.MODEL_NAME,
-                "messages": messages,
-                "temperature": self.settings.TEMPERATURE,
-                "max_tokens": self.settings.MAX_TOKENS,
-                "stream": self.settings.STREAM_ENABLED
-            }
+        payload = {
+            "model": self.settings.MODEL_NAME,
+            "messages": messages,
+            "temperature": self.settings.TEMPERATURE,
+            "max_tokens": self.settings.MAX_TOKENS,
+            "stream": self.settings.STREAM_ENABLED
+        }
 
-            logger.debug(f"Sending request to LLM with {len(messages)} messages")
+        logger.debug(f"Sending request to LLM with {len(messages)} messages")
 
+        try:
             async with self.session.post(
                     f"{self.settings.NVIDIA_BASE_URL}/chat/completions",
-                    json=payload
+                    # Content-Type: application/json comes from the session headers
+                    data=orjson.dumps(payload)
             ) as response:
                 if not response.ok:
                     error_text = await response.text()
                     logger.error(f"LLM API Error: {response.status} - {error_text}")
-                    raise Exception(f"LLM API Error: {response.status} - {error_text}")
-
-                response_text = ""
-                async for line in response.content:
-                    if line:
-                        try:
-                            json_response = json.loads(line)
-                            if content := json_response.get("choices", [{}])[0].get("delta", {}).get("content"):
-                                response_text += content
-                        except json.JSONDecodeError:
-                            continue
+                    response.raise_for_status()
+
+                parts: List[str] = []
+                async for data in self._iter_sse_data(response):
+                    json_response = orjson.loads(data)
+                    # Chunks may carry "choices": [] or "delta": null (e.g. usage-only events)
+                    choices = json_response.get("choices") or [{}]
+                    if content := (choices[0].get("delta") or {}).get("content"):
+                        parts.append(content)
 
                 logger.debug("Response generated successfully")
-                return response_text
+                return "".join(parts)
 
-        except Exception as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            # Only request/transport and payload errors; cancellation and bugs propagate
             logger.error(f"Error generating response: {str(e)}")
             return "I apologize, but I encountered an error processing your request."
+
+    @staticmethod
+    async def _iter_sse_data(response: aiohttp.ClientResponse) -> AsyncIterator[bytes]:
+        """Yield the payload of each `data:` line in a server-sent event stream"""
+        buffer = b""
+        done = False
+        async for chunk in response.content.iter_chunked(4096):
+            # After [DONE], keep reading to EOF so the connection goes back to the pool
+            if done:
+                continue
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                data = LLMManager._parse_sse_line(line)
+                if data == b"[DONE]":
+                    done = True
+                    break
+                if data is not None:
+                    yield data
+
+        # The stream may close without a trailing newline or a [DONE] event
+        if not done:
+            data = LLMManager._parse_sse_line(buffer)
+            if data is not None and data != b"[DONE]":
+                yield data
+
+    @staticmethod
+    def _parse_sse_line(line: bytes) -> Optional[bytes]:
+        """Return the payload of a `data:` line, or None for any other line"""
+        line = line.strip()
+        # Skip keep-alive blank lines, comments and non-data fields
+        if not line.startswith(b"data:"):
+            return None
+        return line[5:].lstrip()
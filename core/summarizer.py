@@ -1,79 +1,86 @@
+import aiohttp
 import asyncio
-from typing import List, Dict
+import orjson
+from typing import List, Dict, Optional
 from config.settings import Settings
 from utils.async_utils import AsyncSessionManager
+from utils.cache import LRUCache, content_key
 
 
 class ConversationSummarizer(AsyncSessionManager):
-    def __init__(self, settings: Settings):
-        super().__init__(settings)
-        self._summary_cache = {}
-        self._summary_lock = asyncio.Lock()
+    def __init__(self, settings: Settings, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(settings, session)
+        self._summary_cache: LRUCache[str] = LRUCache(settings.MAX_CACHE_ITEMS)
+        # Summaries being generated, so concurrent callers share one request
+        self._in_flight: Dict[int, asyncio.Task] = {}
 
     async def get_summary(self, messages: List[Dict[str, str]]) -> str:
         """Generate a summary of the conversation history"""
         cache_key = self._get_cache_key(messages)
 
-        async with self._summary_lock:
-            # Check cache first
-            if cache_key in self._summary_cache:
-                return self._summary_cache[cache_key]
-
-            # Generate new summary
-            summary = await self._generate_summary(messages)
-            self._update_cache(cache_key, summary)
+        # Check cache first
+        summary = self._summary_cache.get(cache_key)
+        if summary is not None:
             return summary
 
-    def _get_cache_key(self, messages: List[Dict[str, str]]) -> str:
-        """Generate a cache key for the messages"""
-        return hash(str(messages))
+        # Join an identical request that is already running, or start one;
+        # different message lists are summarized in parallel
+        task = self._in_flight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._summarize(cache_key, messages))
+            self._in_flight[cache_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(cache_key, None))
+
+        # Shield so one cancelled caller doesn't cancel the others' summary
+        return await asyncio.shield(task)
 
-    def _update_cache(self, key: str, summary: str) -> None:
-        """Update the summary cache and manage its size"""
-        self._summary_cache[key] = summary
+    async def _summarize(self, key: int, messages: List[Dict[str, str]]) -> str:
+        """Generate a summary and cache it if generation succeeded"""
+        summary = await self._generate_summary(self._format_conversation(messages))
+        if summary is None:
+            # Don't cache failures so the next request retries
+            return "Error generating conversation summary."
 
-        # Clean cache if it gets too large
-        if len(self._summary_cache) > self.settings.MAX_CACHE_ITEMS:
-            # Remove oldest entries
-            oldest_keys = sorted(self._summary_cache.keys())[:-self.settings.CACHE_CLEANUP_THRESHOLD]
-            for old_key in oldest_keys:
-                del self._summary_cache[old_key]
+        self._summary_cache.put(key, summary)
+        return summary
 
-    async def _generate_summary(self, messages: List[Dict[str, str]]) -> str:
-        """Generate a summary using the LLM"""
-        async with self._get_session() as session:
-            conversation_text = self._format_conversation(messages)
+    def _get_cache_key(self, messages: List[Dict[str, str]]) -> int:
+        """Generate a stable content hash for the messages"""
+        return content_key(orjson.dumps(messages, option=orjson.OPT_SORT_KEYS))
 
-            payload = {
-                "model": self.settings.MODEL_NAME,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "Create a brief, focused summary of the key points in this conversation."
-                    },
-                    {
-                        "role": "user",
-                        "content": conversation_text
-                    }
-                ],
-                "temperature": self.settings.SUMMARY_TEMPERATURE,
-                "max_tokens": 200
-            }
+    async def _generate_summary(self, conversation_text: str) -> Optional[str]:
+        """Generate a summary using the LLM, or None if the request fails"""
+        session = await self._get_session()
+        payload = {
+            "model": self.settings.MODEL_NAME,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "Create a brief, focused summary of the key points in this conversation."
+                },
+                {
+                    "role": "user",
+                    "content": conversation_text
+                }
+            ],
+            "temperature": self.settings.SUMMARY_TEMPERATURE,
+            "max_tokens": 200
+        }
 
-            try:
-                async with session.post(
-                        f"{self.settings.NVIDIA_BASE_URL}/chat/completions",
-                        json=payload
-                ) as response:
-                    if not response.ok:
-                        raise Exception(f"Summary generation error: {await response.text()}")
+        try:
+            async with session.post(
+                    f"{self.settings.NVIDIA_BASE_URL}/chat/completions",
+                    data=orjson.dumps(payload)
+            ) as response:
+                if not response.ok:
+                    raise Exception(f"Summary generation error: {await response.text()}")
 
-                    result = await response.json()
-                    return result["choices"][0]["message"]["content"]
+                result = orjson.loads(await response.read())
+                return result["choices"][0]["message"]["content"]
 
-            except Exception as e:
-                print(f"Error generating summary: {str(e)}")
-                return "Error generating conversation summary."
+        except Exception as e:
+            print(f"Error generating summary: {str(e)}")
+            return None
 
     def _format_conversation(self, messages: List[Dict[str, str]]) -> str:
         """Format messages for summarization"""
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import List, Tuple, Dict, Any
 from pinecone import Pinecone, PodSpec
@@ -12,9 +13,24 @@ class VectorStore:
         self.embeddings = embeddings
         self.pc = None
         self.index = None
+        # Settings are immutable, so track the index actually in use here
+        self.index_name = settings.PINECONE_INDEX_NAME
+        self._lock = asyncio.Lock()
+        self._initialized = False
 
     async def initialize(self):
         """Initialize the vector store with better error handling"""
+        if self._initialized:
+            return
+
+        async with self._lock:
+            if not self._initialized:
+                # The Pinecone SDK is blocking; keep it off the event loop
+                await asyncio.to_thread(self._connect)
+                self._initialized = True
+
+    def _connect(self):
+        """Connect to Pinecone and open (or create) the configured index"""
         try:
             logger.info("Initializing Pinecone connection...")
             self.pc = Pinecone(api_key=self.settings.PINECONE_API_KEY)
@@ -45,8 +61,28 @@ class VectorStore:
                     index_name = existing_indexes[0]
                     logger.info(f"Using existing index: {index_name}")
                     self.index = self.pc.Index(index_name)
-                    self.settings.PINECONE_INDEX_NAME = index_name
+                    self.index_name = index_name
 
         except Exception as e:
             logger.error(f"Error initializing vector store: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    async def similarity_search(self, query: str, top_k: int = 3) -> List[Tuple[Dict[str, Any], float]]:
+        """Find stored entries similar to the query as (metadata, score) pairs"""
+        try:
+            # Pinecone is only contacted once a search actually needs it; if it is
+            # unreachable, answer without retrieved context and retry next time
+            await self.initialize()
+
+            query_embedding = (await self.embeddings.get_embeddings([query]))[0]
+            results = await asyncio.to_thread(
+                self.index.query,
+                vector=query_embedding.tolist(),
+                top_k=top_k,
+                include_metadata=True
+            )
+            return [(match.metadata or {}, match.score) for match in results.matches]
+
+        except Exception as e:
+            logger.error(f"Error during similarity search: {str(e)}")
+            return []
@@ -1,13 +1,29 @@
 import sqlite3
-from datetime import datetime
-import json
+import threading
+from datetime import datetime, timedelta
+import orjson
 from typing import List, Dict, Optional
 from contextlib import contextmanager
 
+# Bumped in PRAGMA user_version once legacy ISO-8601 timestamps are converted
+SCHEMA_VERSION = 1
+
+
+def _to_epoch_us(moment: datetime) -> int:
+    """Convert a datetime to integer microseconds since the Unix epoch"""
+    return int(moment.timestamp() * 1_000_000)
+
 
 class ConversationStore:
     def __init__(self, db_path: str = "conversations.db"):
         self.db_path = db_path
+        # One long-lived connection in autocommit mode; the lock serializes access
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(
+            "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY;"
+        )
+        self._lock = threading.Lock()
         self._initialize_db()
 
     def _initialize_db(self) -> None:
@@ -21,27 +37,44 @@ class ConversationStore:
                     response TEXT NOT NULL,
                     context TEXT,
                     metadata TEXT,
-                    timestamp DATETIME NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     CONSTRAINT idx_user_timestamp UNIQUE (user_id, timestamp)
                 )
             """)
 
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_user_id 
-                ON conversations(user_id)
-            """)
+            # The UNIQUE (user_id, timestamp) autoindex already serves user_id lookups
+            # and ORDER BY timestamp DESC LIMIT, so a user_id-only index is redundant
+            conn.execute("DROP INDEX IF EXISTS idx_user_id")
+
+            # Convert rows written before timestamps were stored as epoch microseconds;
+            # user_version records that this ran so later opens skip the table scan
+            if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                legacy_rows = conn.execute(
+                    "SELECT id, timestamp FROM conversations WHERE typeof(timestamp) = 'text'"
+                ).fetchall()
+                conn.execute("BEGIN")
+                try:
+                    conn.executemany(
+                        "UPDATE conversations SET timestamp = ? WHERE id = ?",
+                        [(_to_epoch_us(datetime.fromisoformat(row["timestamp"])), row["id"])
+                         for row in legacy_rows]
+                    )
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
 
     @contextmanager
     def _get_connection(self):
-        """Get a database connection with proper error handling"""
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            yield conn
-        finally:
-            if conn:
-                conn.close()
+        """Get exclusive access to the shared database connection"""
+        with self._lock:
+            yield self._conn
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
 
     def add_message(self, user_id: str, message: str, response: str,
                     context: Optional[Dict] = None) -> None:
@@ -55,8 +88,8 @@ class ConversationStore:
                     user_id,
                     message,
                     response,
-                    json.dumps(context) if context else None,
-                    datetime.now().isoformat()
+                    orjson.dumps(context).decode() if context else None,
+                    _to_epoch_us(datetime.now())
                 )
             )
 
@@ -74,9 +107,25 @@ class ConversationStore:
             return [dict(row) for row in cursor.fetchall()]
 
     def get_historical_messages(self, user_id: str, skip: int = 0,
-                                limit: int = 10) -> List[Dict]:
-        """Get historical messages for summarization"""
+                                limit: int = 10,
+                                before_ts: Optional[int] = None) -> List[Dict]:
+        """Get historical messages for summarization
+
+        Pass the timestamp of the oldest message from the previous page as
+        ``before_ts`` to page without OFFSET; ``skip`` is then ignored.
+        """
         with self._get_connection() as conn:
+            if before_ts is not None:
+                cursor = conn.execute(
+                    """SELECT message, response, timestamp 
+                    FROM conversations 
+                    WHERE user_id = ? AND timestamp < ? 
+                    ORDER BY timestamp DESC 
+                    LIMIT ?""",
+                    (user_id, before_ts, limit)
+                )
+                return [dict(row) for row in cursor.fetchall()]
+
             cursor = conn.execute(
                 """SELECT message, response, timestamp 
                 FROM conversations 
@@ -90,7 +139,7 @@ class ConversationStore:
     def clean_old_messages(self, days_old: int = 30) -> None:
         """Clean up old messages to manage database size"""
         with self._get_connection() as conn:
-            threshold = (datetime.now() - datetime.timedelta(days=days_old)).isoformat()
+            threshold = _to_epoch_us(datetime.now() - timedelta(days=days_old))
             conn.execute(
                 "DELETE FROM conversations WHERE timestamp < ?",
                 (threshold,)
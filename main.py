@@ -1,11 +1,15 @@
+import aiohttp
 import asyncio
 import logging
-from typing import List, Dict, Optional
+import orjson
+from typing import Any, List, Dict, Optional, Set, Tuple
 from config.settings import Settings
 from core.embeddings import NvidiaEmbeddings
 from core.llm import LLMManager
 from core.vector_store import VectorStore
 from core.conversation_manager import ConversationManager
+from utils.async_utils import create_session
+from utils.cache import LRUCache, content_key
 
 # Set up logging
 logging.basicConfig(
@@ -23,13 +27,18 @@ class EnhancedChatbot:
         try:
             # Initialize basic attributes
             self._initialized = False
+            self._pending: Set[asyncio.Task] = set()
             self.settings = settings or Settings()
+            self._prompt_cache: LRUCache[str] = LRUCache(self.settings.MAX_CACHE_ITEMS)
             logger.info("Initializing chatbot components...")
 
+            # HTTP-backed components share one session, created in initialize()
+            self.http: Optional[aiohttp.ClientSession] = None
+            self.embeddings: Optional[NvidiaEmbeddings] = None
+            self.llm: Optional[LLMManager] = None
+            self.vector_store: Optional[VectorStore] = None
+
             # Initialize core components
-            self.embeddings = NvidiaEmbeddings(self.settings)
-            self.llm = LLMManager(self.settings)
-            self.vector_store = VectorStore(self.settings, self.embeddings)
             self.conversation_manager = ConversationManager(self.settings)
 
             logger.info("Base components initialized successfully")
@@ -43,14 +52,13 @@ class EnhancedChatbot:
             return
 
         try:
-            # Initialize vector store first
-            logger.info("Initializing vector store...")
-            await self.vector_store.initialize()
-
-            # Initialize LLM manager
-            logger.info("Initializing LLM manager...")
-            await self.llm.initialize()
+            # Create the application-wide HTTP session and inject it
+            self.http = create_session(self.settings)
+            self.embeddings = NvidiaEmbeddings(self.settings, self.http)
+            self.llm = LLMManager(self.settings, self.http)
+            self.vector_store = VectorStore(self.settings, self.embeddings)
 
+            # Vector store and LLM manager initialize themselves on first use
             self._initialized = True
             logger.info("Chatbot initialization complete")
 
@@ -60,15 +68,39 @@ class EnhancedChatbot:
             await self.close()
             raise
 
+    async def reset(self):
+        """Replace the shared HTTP session after an unrecoverable error
+
+        Ordinary request failures don't need this; the connector recycles bad
+        connections on its own. Requests still using the old session will fail.
+        """
+        if not self._initialized:
+            return
+
+        logger.info("Resetting shared HTTP session...")
+        old_http, self.http = self.http, create_session(self.settings)
+        await self.embeddings.use_session(self.http)
+        await self.llm.use_session(self.http)
+        await old_http.close()
+        logger.info("Shared HTTP session reset")
+
     async def close(self):
         """Cleanup resources"""
         try:
-            if hasattr(self, 'llm'):
+            # Let background saves finish before tearing anything down
+            if getattr(self, '_pending', None):
+                await asyncio.gather(*self._pending, return_exceptions=True)
+
+            if getattr(self, 'llm', None):
                 await self.llm.close()
-            if hasattr(self, 'embeddings') and hasattr(self.embeddings, 'close'):
+            if getattr(self, 'embeddings', None):
                 await self.embeddings.close()
             if hasattr(self, 'conversation_manager') and hasattr(self.conversation_manager, 'close'):
                 await self.conversation_manager.close()
+            if getattr(self, 'http', None):
+                # Components only release their reference; the session is closed once here
+                await self.http.close()
+                self.http = None
 
             self._initialized = False
             logger.info("Cleanup completed successfully")
@@ -86,21 +118,17 @@ class EnhancedChatbot:
             logger.info(f"Processing message for user {user_id}")
 
             # Get conversation context and relevant information in parallel
-            tasks = [
-                self.conversation_manager.get_context(user_id),
-                self.vector_store.similarity_search(message)
-            ]
+            async with asyncio.TaskGroup() as tg:
+                context_task = tg.create_task(self.conversation_manager.get_context(user_id))
+                search_task = tg.create_task(self.vector_store.similarity_search(message))
 
-            # Wait for all parallel tasks
-            context, search_results = await asyncio.gather(*tasks)
+            context, search_results = context_task.result(), search_task.result()
 
             # Prepare messages for the model
             messages = [
                 {
                     "role": "system",
-                    "content": f"""You are a helpful assistant. 
-                    Previous conversation summary: {context['summary']}
-                    Relevant context: {' '.join([r[0].get('text', '') for r in search_results])}"""
+                    "content": self._get_system_prompt(context['summary'], search_results)
                 }
             ]
 
@@ -119,8 +147,8 @@ class EnhancedChatbot:
             logger.info("Generating response...")
             response = await self.llm.generate_response(messages)
 
-            # Save conversation
-            await self.conversation_manager.add_message(
+            # Save conversation in the background so the reply isn't held up
+            save_task = asyncio.create_task(self.conversation_manager.add_message(
                 user_id=user_id,
                 message=message,
                 response=response,
@@ -128,15 +156,36 @@ class EnhancedChatbot:
                     "search_results": search_results,
                     "summary_used": bool(context.get("summary"))
                 }
-            )
+            ))
+            self._pending.add(save_task)
+            save_task.add_done_callback(self._pending.discard)
 
             logger.info("Message processing completed successfully")
             return response
 
         except Exception as e:
-            logger.error(f"Error processing message: {str(e)}")
+            # logger.exception keeps the traceback, including TaskGroup sub-exceptions
+            logger.exception(f"Error processing message: {str(e)}")
             return "I apologize, but I encountered an error processing your request."
 
+    def _get_system_prompt(self, summary: str,
+                           search_results: List[Tuple[Dict[str, Any], float]]) -> str:
+        """Build the system prompt, reusing it when summary and context are unchanged"""
+        texts = [r[0].get('text', '') for r in search_results]
+
+        # JSON keeps piece boundaries unambiguous, unlike joining on a separator
+        key = content_key(orjson.dumps([summary, texts]))
+
+        prompt = self._prompt_cache.get(key)
+        if prompt is not None:
+            return prompt
+
+        prompt = f"""You are a helpful assistant. 
+                    Previous conversation summary: {summary}
+                    Relevant context: {' '.join(texts)}"""
+        self._prompt_cache.put(key, prompt)
+        return prompt
+
 
 async def main():
     chatbot = None
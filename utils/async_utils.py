@@ -1,32 +1,73 @@
 import aiohttp
 import asyncio
-from contextlib import asynccontextmanager
+from typing import Optional
 from config.settings import Settings
 
 
+def create_session(settings: Settings) -> aiohttp.ClientSession:
+    """Create a client session configured for the Nvidia API"""
+    # This is the app's only pool: streamed replies hold a connection for the
+    # whole generation, so leave headroom for embedding and summary calls.
+    # Connections and resolved DNS are kept around between requests.
+    connector = aiohttp.TCPConnector(
+        limit=settings.MAX_PARALLEL_REQUESTS * 4,
+        limit_per_host=settings.MAX_PARALLEL_REQUESTS * 4,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+        ttl_dns_cache=300
+    )
+    return aiohttp.ClientSession(
+        headers=settings.headers,
+        timeout=aiohttp.ClientTimeout(total=settings.REQUEST_TIMEOUT),
+        connector=connector
+    )
+
+
 class AsyncSessionManager:
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, session: Optional[aiohttp.ClientSession] = None):
         self.settings = settings
-        self._session = None
+        self._session = session
+        # Injected sessions are shared and closed by their owner
+        self._owns_session = session is None
         self._lock = asyncio.Lock()
 
-    @asynccontextmanager
-    async def _get_session(self):
-        if self._session is None:
-            async with self._lock:
-                if self._session is None:
-                    self._session = aiohttp.ClientSession(
-                        headers=self.settings.headers,
-                        timeout=aiohttp.ClientTimeout(total=self.settings.REQUEST_TIMEOUT)
-                    )
-        try:
-            yield self._session
-        except Exception as e:
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the session, creating it on first use"""
+        if self._session is not None:
+            return self._session
+
+        async with self._lock:
+            if self._session is None:
+                self._session = create_session(self.settings)
+                self._owns_session = True
+        return self._session
+
+    async def reset(self):
+        """Drop an owned session so the next request opens a fresh one
+
+        Only for unrecoverable failures such as a broken connector; ordinary
+        request errors should leave the pooled connections alone. A new session
+        reuses the same settings, so it won't help with revoked credentials.
+        Injected sessions are left untouched: dropping the reference would make
+        this manager open a private pool. EnhancedChatbot.reset() replaces the
+        shared session and hands it over through use_session().
+        """
+        if not self._owns_session:
+            return
+
+        async with self._lock:
+            await self.close()
+
+    async def use_session(self, session: aiohttp.ClientSession):
+        """Switch to a session owned by the caller, closing any session of our own"""
+        async with self._lock:
             await self.close()
-            raise e
+            self._session = session
+            self._owns_session = False
 
     async def close(self):
         """Close the session and cleanup resources"""
         if self._session:
-            await self._session.close()
-            self._session = None
\ No newline at end of file
+            if self._owns_session:
+                await self._session.close()
+            self._session = None
@@ -0,0 +1,36 @@
+import hashlib
+from collections import OrderedDict
+from typing import Generic, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+def content_key(data: bytes) -> int:
+    """Generate a stable 64-bit content hash for the given bytes"""
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+class LRUCache(Generic[V]):
+    """Bounded cache that evicts the least recently used entry"""
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self._items: "OrderedDict[int, V]" = OrderedDict()
+
+    def get(self, key: int) -> Optional[V]:
+        """Return the cached value, marking it as recently used"""
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def put(self, key: int, value: V) -> None:
+        """Store a value, evicting the oldest entry if the cache is full"""
+        self._items[key] = value
+        self._items.move_to_end(key)
+
+        if len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)